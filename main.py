@@ -1,14 +1,66 @@
 import os
+import io
+import glob
+import csv
+import functools
+import collections
 import pandas as pd
 import sqlite3
 import tkinter as tk
 from tkinter import filedialog
 from tkinter import ttk
 import time
+import threading
+import queue
 from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    # Arrow's CSV reader is optional, CSV files are parsed by the csv module without it
+    pa_csv = None
+
+try:
+    import adbc_driver_sqlite.dbapi as adbc_sqlite
+except ImportError:
+    # The ADBC loader is optional, rows are inserted through sqlite3 without it
+    adbc_sqlite = None
+
+# Indexes built on every case table, each given as the tuple of its columns. The compound index on
+# (案由, 法院, 案号) also serves lookups on 案由 alone, and answers 案由 + 法院 searches for case numbers
+# without reading the table rows
+DEFAULT_INDEXES = [("案件名称",), ("案号",), ("法院",), ("案由", "法院", "案号")]
+
+# CSV columns that are not stored in the database
+SKIPPED_COLUMNS = ["案件类型编码", "来源"]
+
+# Settings of a worker process, set by _init_worker, and the loader connection and part database it
+# writes to, opened by the first file the worker loads
+_worker_db_name = None
+_worker_quick_mode = False
+_worker_connection = None
+_worker_part_db = None
+
+# Interval, in milliseconds, at which the GUI polls the progress of a running import
+PROGRESS_POLL_INTERVAL = 50
+
+# Text columns covered by the trigram full-text index used for fuzzy searches. 全文 is left out: a trigram
+# index over the full judgments would be several times larger than the text itself and slow every import
+FTS_COLUMNS = ["案件名称", "案号", "法院", "当事人", "案由", "法律依据"]
+
+# Columns covered by the separate, optional full-text index over the judgments, only built when asked for
+# from "Recreate ALL Index" and kept up to date by later imports once it exists
+FULLTEXT_FTS_COLUMNS = ["全文"]
+
+# Connections reused by the query functions, keyed by database name, and the lock guarding them
+_query_connections = {}
+_query_lock = threading.RLock()
 
 
 def timing_decorator(func):
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time.time()
         result = func(*args, **kwargs)
@@ -20,22 +72,77 @@ def timing_decorator(func):
     return wrapper
 
 
+def _scan_csv_files(directory: str):
+    """
+    Scan a single directory level for CSV files using os.scandir.
+
+    Args:
+        directory (str): The directory to scan.
+
+    Returns:
+        tuple: A list of CSV file paths and a list of subdirectory paths found in the directory.
+    """
+    csv_files = []
+    sub_dirs = []
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # DirEntry caches the file type, so no extra stat call is needed
+                if entry.is_dir(follow_symlinks=False):
+                    sub_dirs.append(entry.path)
+                # Compare the extension case-insensitively so '.CSV' files are found too
+                elif entry.name[-4:].lower() == '.csv' and entry.is_file():
+                    csv_files.append(entry.path)
+    except OSError as e:
+        # Skip unreadable directories, as os.walk does
+        print(f"Skipping {directory}: {e}")
+
+    return csv_files, sub_dirs
+
+
+def _scan_csv_files_recursive(directory: str):
+    """
+    Recursively find all CSV files in a directory and its subdirectories.
+
+    Args:
+        directory (str): The directory to start searching from.
+
+    Returns:
+        list: A list of CSV file paths.
+    """
+    csv_files = []
+
+    # Walk the tree with an explicit stack rather than recursion, so deep trees cannot hit the
+    # recursion limit. Subdirectories are pushed in reverse to be visited in the order they were found
+    stack = [directory]
+    while stack:
+        dir_files, sub_dirs = _scan_csv_files(stack.pop())
+        csv_files.extend(dir_files)
+        stack.extend(reversed(sub_dirs))
+
+    return csv_files
+
+
 def find_csv_files(start_dir: str):
     """
     Recursively find all CSV files in a directory and its subdirectories.
 
+    The first-level subdirectories are walked in parallel by a thread pool, as directory
+    reads are I/O-bound.
+
     Args:
         start_dir (str): The directory to start searching from.
 
     Returns:
         list: A list of CSV file paths.
     """
-    csv_files = []
+    csv_files, sub_dirs = _scan_csv_files(start_dir)
 
-    for root, dirs, files in os.walk(start_dir):
-        for file in files:
-            if file.endswith('.csv'):
-                csv_files.append(os.path.join(root, file))
+    if sub_dirs:
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+            for sub_dir_files in executor.map(_scan_csv_files_recursive, sub_dirs):
+                csv_files.extend(sub_dir_files)
 
     return csv_files
 
@@ -55,11 +162,370 @@ def create_database(db_name='Chinese_Cases.db'):
     if not os.path.exists(db_name):
         print(f"The database file {db_name} does not exist. Creating...")
         db_connection = sqlite3.connect(db_name)
+        # Page size and auto-vacuum can only be chosen before any table exists
+        db_connection.execute('PRAGMA page_size = 65536;')
+        db_connection.execute('PRAGMA auto_vacuum = NONE;')
+        # WAL is persistent, so every later connection writes through the log
+        db_connection.execute('PRAGMA journal_mode = WAL;')
+        db_connection.execute('PRAGMA synchronous = NORMAL;')
         db_connection.close()
 
 
+def get_create_table_query(table_name):
+    """
+    Function to build the SQL statement creating a case table if it doesn't exist.
+
+    Parameters:
+    - table_name (str): The name of the table.
+
+    Returns:
+    - create_table_query (str): The CREATE TABLE statement.
+    """
+    return f"""
+    CREATE TABLE IF NOT EXISTS '{str(table_name)}' (
+        原始链接 TEXT,
+        案号 TEXT,
+        案件名称 TEXT,
+        法院 TEXT,
+        所属地区 TEXT,
+        案件类型 TEXT,
+        审理程序 TEXT,
+        裁判日期 TEXT,
+        公开日期 TEXT,
+        当事人 TEXT,
+        案由 TEXT,
+        法律依据 TEXT,
+        全文 TEXT
+    );
+    """
+
+
+def read_csv_header(csv_file, delimiter=','):
+    """
+    Function to read the column names from the first line of a CSV file.
+
+    Parameters:
+    - csv_file (str): The path of the CSV file.
+    - delimiter (str): The delimiter used in the CSV file to separate values. Default is ','.
+
+    Returns:
+    - header (list): The column names, without any UTF-8 byte order mark.
+    """
+    with open(csv_file, encoding='utf-8-sig', newline='') as file:
+        return next(csv.reader(file, delimiter=delimiter), [])
+
+
+def iter_csv_batches(csv_file, delimiter=',', batch_size=10000):
+    """
+    Function to stream the stored columns of a CSV file as batches of row tuples, using the csv module.
+
+    Columns in SKIPPED_COLUMNS are left out, and empty fields become None so they are stored as NULL.
+
+    Parameters:
+    - csv_file (str): The path of the CSV file.
+    - delimiter (str): The delimiter used in the CSV file to separate values. Default is ','.
+    - batch_size (int): The maximum number of rows per batch. Default is 10000.
+
+    Returns:
+    - batches (generator): Lists of row tuples, with the columns in file order.
+    """
+    # Read the file through a 1 MiB buffer instead of the default 8 KiB, so large files, especially on
+    # network shares, take far fewer read calls
+    with open(csv_file, encoding='utf-8-sig', newline='', buffering=1 << 20) as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        header = next(reader, [])
+        keep = [i for i, col in enumerate(header) if col not in SKIPPED_COLUMNS]
+        padding = [''] * len(header)
+
+        batch = []
+        for row in reader:
+            # Skip blank lines and pad short rows, as pandas does
+            if not row:
+                continue
+            if len(row) < len(header):
+                row += padding[len(row):]
+
+            batch.append(tuple([row[i] or None for i in keep]))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+
+def rows_to_record_batch(rows, columns):
+    """
+    Function to turn rows of text values into an Arrow record batch of string columns.
+
+    Parameters:
+    - rows (list): The rows, each a sequence of values in the order of columns.
+    - columns (list): The column names.
+
+    Returns:
+    - batch (pyarrow.RecordBatch): The rows as a record batch.
+    """
+    return pa.RecordBatch.from_arrays([pa.array(values, type=pa.string()) for values in zip(*rows)], names=columns)
+
+
+def open_csv_with_arrow(csv_file, delimiter=',', columns=None):
+    """
+    Function to open a CSV file as a stream of record batches with pyarrow's CSV reader.
+
+    Rows whose number of fields differs from the header are parsed with the csv module instead and padded
+    as iter_csv_batches does. When too many of them come at once, reading stops with pyarrow.ArrowInvalid,
+    and the caller should load the file with iter_csv_batches.
+
+    Parameters:
+    - csv_file (str): The path of the CSV file.
+    - delimiter (str): The delimiter used in the CSV file to separate values. Default is ','.
+    - columns (list): The stored columns of the file, when the caller has already read its header. Default is
+      None, which reads them from the header.
+
+    Returns:
+    - batches (generator): Record batches of the stored columns.
+    """
+    if columns is None:
+        columns = [col for col in read_csv_header(csv_file, delimiter) if col not in SKIPPED_COLUMNS]
+
+    # Arrow rejects rows with more or fewer fields than the header, which iter_csv_batches pads or
+    # truncates instead. Set their text aside, from the parsing threads, and load them after the batch
+    # they were found in. At most 10000 are kept: more at once means a systematic difference, such as a
+    # trailing delimiter on every row, so fail the parse rather than hold the whole file in memory
+    invalid_rows = collections.deque()
+
+    def _set_aside(row):
+        if len(invalid_rows) >= 10000:
+            return 'error'
+        invalid_rows.append(row.text)
+        return 'skip'
+
+    # Parse in 64 MiB blocks, on several threads unless this is a pool worker of _ingest_worker: the pool
+    # already runs a process per CPU, and an Arrow thread per CPU in each of them would oversubscribe
+    # the CPUs and keep several blocks in memory per process. Quoted values such as 全文 may span
+    # several lines, so the blocks are split at row ends only. Keep every column as text, so no type is
+    # inferred, and only treat empty fields as missing values
+    use_threads = _worker_db_name is None
+    reader = pa_csv.open_csv(csv_file,
+                             read_options=pa_csv.ReadOptions(block_size=64 << 20, use_threads=use_threads),
+                             parse_options=pa_csv.ParseOptions(delimiter=delimiter,
+                                                               newlines_in_values=True,
+                                                               invalid_row_handler=_set_aside),
+                             convert_options=pa_csv.ConvertOptions(include_columns=columns,
+                                                                   column_types={col: pa.string() for col in columns},
+                                                                   null_values=[''],
+                                                                   strings_can_be_null=True))
+
+    header = None
+
+    def _flush_set_aside():
+        nonlocal header
+        if not invalid_rows:
+            return
+
+        texts = []
+        while invalid_rows:
+            texts.append(invalid_rows.popleft())
+
+        # Parse the rows set aside with the csv module, padding short rows as iter_csv_batches does
+        if header is None:
+            header = read_csv_header(csv_file, delimiter)
+        keep = [header.index(col) for col in columns]
+        padding = [''] * len(header)
+
+        rows = []
+        for row in csv.reader(io.StringIO('\n'.join(texts)), delimiter=delimiter):
+            if len(row) < len(header):
+                row += padding[len(row):]
+            rows.append([row[i] or None for i in keep])
+
+        yield rows_to_record_batch(rows, columns)
+
+    for batch in reader:
+        yield batch
+        yield from _flush_set_aside()
+
+    # A last block made only of set-aside rows yields no batch of its own
+    yield from _flush_set_aside()
+
+
+def use_adbc_loader():
+    """
+    Function to tell whether CSV files are loaded through ADBC, which needs both pyarrow and adbc_driver_sqlite.
+
+    Returns:
+    - use_adbc (bool): True if the ADBC loader is available.
+    """
+    return adbc_sqlite is not None and pa_csv is not None
+
+
+def open_loader_connection(db_name, quick_mode=False, temporary=False):
+    """
+    Function to open a database connection tuned for bulk loading, to be reused for every file of an import.
+
+    The connection comes from the ADBC driver when use_adbc_loader() is True, and from sqlite3 otherwise.
+    ADBC links its own copy of SQLite, and two SQLite libraries in one process do not see each other's
+    file locks, so a process loading through ADBC must not hold a sqlite3 connection to the same database.
+
+    Parameters:
+    - db_name (str): The name of the SQLite database file.
+    - quick_mode (bool): If True, enables quick mode by adjusting SQLite PRAGMA settings for faster data loading.
+    - temporary (bool): If True, the database is a part file owned by this connection and discarded if the
+      import fails, so its journal is kept in memory, and syncing and file locking between writes are turned
+      off. Otherwise the database is opened in WAL mode and waits up to 5 seconds for a lock held by a
+      query. Default is False.
+
+    Returns:
+    - conn: An open ADBC or sqlite3 connection to the database.
+    """
+    if temporary:
+        # The part is still empty, so it can use the large pages of the target database. The page
+        # size has to be chosen before the journal mode. Nothing needs to reach the disk, but the
+        # journal is kept in memory rather than turned off, as ROLLBACK is undefined without one
+        # and a failed file must be rolled back. No other connection opens the part, so lock it once
+        pragmas = ['PRAGMA page_size = 65536;',
+                   'PRAGMA journal_mode = MEMORY;',
+                   'PRAGMA synchronous = OFF;',
+                   'PRAGMA locking_mode = EXCLUSIVE;']
+    else:
+        # In WAL mode synchronous=NORMAL only skips fsyncs that are not needed to keep the database
+        # consistent. Wait for a lock held by a query as long as sqlite3 does by default, which ADBC does not
+        pragmas = ['PRAGMA busy_timeout = 5000;',
+                   'PRAGMA journal_mode = WAL;',
+                   'PRAGMA synchronous = NORMAL;']
+
+    pragmas.append('PRAGMA temp_store = MEMORY;')
+
+    # Adjust SQLite PRAGMA settings for quick mode: a 256 MiB page cache and memory-mapped reads
+    if quick_mode:
+        pragmas += ['PRAGMA cache_size = -262144;',
+                    'PRAGMA mmap_size = 268435456;']
+    else:
+        pragmas.append('PRAGMA cache_size = -200000;')
+
+    if use_adbc_loader():
+        # PRAGMAs cannot change inside a transaction, so keep ADBC in autocommit mode and begin
+        # transactions explicitly
+        conn = adbc_sqlite.connect(db_name, autocommit=True)
+        with conn.cursor() as cursor:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+    else:
+        # Keep more prepared statements than the default 128, as the connection is reused for every file
+        conn = sqlite3.connect(db_name, cached_statements=256)
+        for pragma in pragmas:
+            conn.execute(pragma)
+
+    return conn
+
+
+def _load_csv_with_arrow(conn, csv_file, table_name, create_table_query, delimiter=','):
+    """
+    Load a CSV file into a table with pyarrow's multithreaded CSV reader and the ADBC SQLite driver.
+
+    The file is streamed as Arrow record batches, which ADBC binds column by column instead of
+    building a Python tuple per row. All batches are inserted in a single transaction.
+
+    Parameters:
+    - conn: An ADBC connection from open_loader_connection.
+    - csv_file (str): The path of the CSV file to be loaded.
+    - table_name (str): The name of the table in the database where the data will be added.
+    - create_table_query (str): The SQL statement creating the table if it doesn't exist.
+    - delimiter (str): The delimiter used in the CSV file to separate values. Default is ','.
+
+    Returns:
+    None
+    """
+    columns = [col for col in read_csv_header(csv_file, delimiter) if col not in SKIPPED_COLUMNS]
+
+    with conn.cursor() as cursor:
+        # Take the write lock up front and create the table in the same transaction as the rows,
+        # so the whole file costs a single commit
+        cursor.execute('BEGIN IMMEDIATE;')
+        try:
+            cursor.execute(create_table_query)
+
+            # If Arrow cannot parse the file, undo the rows it gave and load the file with the csv module
+            cursor.execute('SAVEPOINT arrow_rows;')
+            try:
+                for batch in open_csv_with_arrow(csv_file, delimiter, columns):
+                    cursor.adbc_ingest(table_name, batch, mode='append')
+            except pa.ArrowInvalid as e:
+                print(f"Loading {csv_file} with the csv module instead: {e}")
+                cursor.execute('ROLLBACK TO arrow_rows;')
+                for rows in iter_csv_batches(csv_file, delimiter):
+                    cursor.adbc_ingest(table_name, rows_to_record_batch(rows, columns), mode='append')
+            cursor.execute('RELEASE arrow_rows;')
+
+            cursor.execute('COMMIT;')
+        except Exception:
+            # A cursor whose ingest failed may still hold its statement, and a ROLLBACK through it does not
+            # end the transaction. Roll back on a fresh cursor, so the connection can load the next file
+            with conn.cursor() as rollback_cursor:
+                rollback_cursor.execute('ROLLBACK;')
+            raise
+
+
+def _load_csv_with_sqlite3(conn, csv_file, table_name, create_table_query, delimiter=','):
+    """
+    Load a CSV file into a table in chunks, inserting the rows with sqlite3's executemany.
+
+    Parameters:
+    - conn (sqlite3.Connection): A sqlite3 connection from open_loader_connection.
+    - csv_file (str): The path of the CSV file to be loaded.
+    - table_name (str): The name of the table in the database where the data will be added.
+    - create_table_query (str): The SQL statement creating the table if it doesn't exist.
+    - delimiter (str): The delimiter used in the CSV file to separate values. Default is ','.
+
+    Returns:
+    None
+    """
+    # Build the insert statement once, for the stored columns in file order. Every file of a table
+    # gives the same SQL text, so the connection reuses the statement it has already prepared
+    columns = [col for col in read_csv_header(csv_file, delimiter) if col not in SKIPPED_COLUMNS]
+    quoted_columns = ', '.join(f'"{col}"' for col in columns)
+    placeholders = ', '.join('?' * len(columns))
+    insert_query = f'INSERT INTO "{table_name}" ({quoted_columns}) VALUES ({placeholders})'
+
+    # Create the table and insert new records into it in batches, all inside a single
+    # transaction that is committed on success and rolled back on error. The write lock
+    # is taken up front, so the file costs a single commit
+    conn.execute('BEGIN IMMEDIATE;')
+    try:
+        cursor = conn.cursor()
+
+        # Execute the table creation query
+        cursor.execute(create_table_query)
+
+        # Parse with Arrow's multithreaded reader, which streams fixed-size batches of string
+        # columns without inferring any types. If it cannot parse the file, undo the rows it gave
+        # and stream the rows straight from the csv module, so memory stays bounded regardless
+        # of file size
+        arrow_failed = pa_csv is None
+        if not arrow_failed:
+            cursor.execute('SAVEPOINT arrow_rows;')
+            try:
+                for batch in open_csv_with_arrow(csv_file, delimiter, columns):
+                    # Turn the columns into rows directly, missing values already come out as None
+                    cursor.executemany(insert_query, zip(*(column.to_pylist() for column in batch.columns)))
+            except pa.ArrowInvalid as e:
+                print(f"Loading {csv_file} with the csv module instead: {e}")
+                cursor.execute('ROLLBACK TO arrow_rows;')
+                arrow_failed = True
+            cursor.execute('RELEASE arrow_rows;')
+
+        if arrow_failed:
+            for batch in iter_csv_batches(csv_file, delimiter):
+                cursor.executemany(insert_query, batch)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
 @timing_decorator
-def adding_CSV(db_name='Chinese_Cases.db', csv_file='', table_name='chinese_cases', delimiter=',', quick_mode=False):
+def adding_CSV(db_name='Chinese_Cases.db', csv_file='', table_name='chinese_cases', delimiter=',', quick_mode=False,
+               conn=None):
     """
     This function adds data from a CSV file to a specified table in a SQLite database.
 
@@ -69,68 +535,34 @@ def adding_CSV(db_name='Chinese_Cases.db', csv_file='', table_name='chinese_case
     - table_name (str): The name of the table in the database where the data will be added. Default is 'chinese_cases'.
     - delimiter (str): The delimiter used in the CSV file to separate values. Default is ','.
     - quick_mode (bool): If True, enables quick mode by adjusting SQLite PRAGMA settings for faster data loading.
+    - conn: A connection from open_loader_connection to load through, so that several files share one
+      connection. Default is None, which opens a connection for this file only, using db_name and quick_mode.
 
     Returns:
     None
     """
     try:
-        # Check if the csv_file path is valid and ends with '.csv'
-        if csv_file and csv_file.endswith('.csv'):
+        # Check if the csv_file path is valid and ends with '.csv', in any case
+        if csv_file and csv_file[-4:].lower() == '.csv':
             print(f"Loading {csv_file} into the database...")
-            with sqlite3.connect(db_name) as conn:
-                # Adjust SQLite PRAGMA settings for quick mode
-                if quick_mode:
-                    conn.execute('PRAGMA journal_mode = OFF;')
-                    conn.execute('PRAGMA synchronous = OFF;')
-                    conn.execute('PRAGMA cache_size = 2000000;')
-                    conn.execute('PRAGMA locking_mode = EXCLUSIVE;')
-                    conn.execute('PRAGMA temp_store = MEMORY;')
-
-                # Define the SQL query to create the table if it doesn't exist
-                create_table_query = f"""
-                CREATE TABLE IF NOT EXISTS '{str(table_name)}' (
-                    原始链接 TEXT,
-                    案号 TEXT,
-                    案件名称 TEXT,
-                    法院 TEXT,
-                    所属地区 TEXT,
-                    案件类型 TEXT,
-                    审理程序 TEXT,
-                    裁判日期 TEXT,
-                    公开日期 TEXT,
-                    当事人 TEXT,
-                    案由 TEXT,
-                    法律依据 TEXT,
-                    全文 TEXT
-                );
-                """
-                # Execute the table creation query
-                conn.execute(create_table_query)
-
-                try:
-                    # Read the CSV file, skipping NaN values and specified columns
-                    df = pd.read_csv(csv_file,
-                                     delimiter=delimiter,
-                                     keep_default_na=False,
-                                     na_values=[''],
-                                     usecols=lambda col: col not in ["案件类型编码", "来源"],
-                                     chunksize=100000
-                                     )
-
-                    # Insert new records into the database table in chunks
-                    for chunk in df:
-                        chunk.to_sql(table_name,
-                                     con=conn,
-                                     if_exists='append',
-                                     index=False,
-                                     chunksize=1000,
-                                     )
-
-                    # Commit changes to the database
-                    conn.commit()
-                except Exception as e:
-                    conn.rollback()
-                    print(f"Error loading {csv_file}: {e}")
+            # Define the SQL query to create the table if it doesn't exist
+            create_table_query = get_create_table_query(table_name)
+
+            own_connection = conn is None
+            if own_connection:
+                conn = open_loader_connection(db_name, quick_mode)
+
+            try:
+                if use_adbc_loader():
+                    # Parse with Arrow and insert its columnar batches through ADBC
+                    _load_csv_with_arrow(conn, csv_file, table_name, create_table_query, delimiter)
+                else:
+                    _load_csv_with_sqlite3(conn, csv_file, table_name, create_table_query, delimiter)
+            except Exception as e:
+                print(f"Error loading {csv_file}: {e}")
+            finally:
+                if own_connection:
+                    conn.close()
 
         else:
             print("No valid CSV file provided or found.")
@@ -142,62 +574,435 @@ def adding_CSV(db_name='Chinese_Cases.db', csv_file='', table_name='chinese_case
         print(f"Exception error: {e}")
 
 
+def _init_worker(db_name, quick_mode):
+    """
+    Set up a worker process, used as the initializer of the ProcessPoolExecutor in _ingest_worker.
+
+    Each worker writes to its own part database next to the target database, so the workers never wait
+    for each other's write lock, and _ingest_worker merges the parts into the target database afterwards.
+    The part is only created by the first file the worker loads, so an idle worker leaves nothing behind.
+    """
+    global _worker_db_name, _worker_quick_mode
+    _worker_db_name = db_name
+    _worker_quick_mode = quick_mode
+
+
+def _open_worker_connection():
+    """
+    Open the loader connection of a worker process to its part database, reused by every file the process loads.
+    """
+    global _worker_connection, _worker_part_db
+
+    # Start from an empty part, in case a crashed import with the same process id left one behind
+    _worker_part_db = f"{_worker_db_name}.part{os.getpid()}"
+    if os.path.exists(_worker_part_db):
+        os.remove(_worker_part_db)
+
+    _worker_connection = open_loader_connection(_worker_part_db, _worker_quick_mode, temporary=True)
+
+
+def _in_transaction(conn):
+    """
+    Function to tell whether a connection from open_loader_connection has a transaction in progress.
+
+    Parameters:
+    - conn: An open ADBC or sqlite3 connection.
+
+    Returns:
+    - in_transaction (bool): True if a transaction is still open.
+    """
+    if isinstance(conn, sqlite3.Connection):
+        return conn.in_transaction
+
+    # ADBC does not report it, but BEGIN fails while a transaction is open
+    with conn.cursor() as cursor:
+        try:
+            cursor.execute('BEGIN;')
+        except Exception:
+            return True
+        cursor.execute('ROLLBACK;')
+        return False
+
+
+def _load_in_worker(csv_file, table_name, delimiter):
+    """
+    Load a CSV file into the part database of the current worker process.
+
+    Returns the path of the part database.
+    """
+    global _worker_connection
+
+    if _worker_connection is None:
+        _open_worker_connection()
+
+    adding_CSV(csv_file=csv_file,
+               table_name=table_name,
+               delimiter=delimiter,
+               conn=_worker_connection)
+
+    # A failed load must not leave its transaction open on the connection, or every later file of this
+    # worker would fail to begin its own. Start over with a new connection to the part if it did
+    if _in_transaction(_worker_connection):
+        _worker_connection.close()
+        _worker_connection = open_loader_connection(_worker_part_db, _worker_quick_mode, temporary=True)
+
+    return _worker_part_db
+
+
+def find_part_databases(db_name):
+    """
+    Function to list the part databases that worker processes have written for a SQLite database.
+
+    Parameters:
+    - db_name (str): The name of the SQLite database file.
+
+    Returns:
+    - part_dbs (list): The paths of the part database files, named '{db_name}.part{pid}'.
+    """
+    prefix = f"{db_name}.part"
+    return [path for path in glob.glob(f"{glob.escape(prefix)}*") if path[len(prefix):].isdigit()]
+
+
+@timing_decorator
+def merge_part_databases(db_name, part_dbs, quick_mode=False, conn=None):
+    """
+    This function copies the tables of part databases into a SQLite database, then deletes the parts.
+
+    Every table of a part is appended to the table of the same name in the database, which must already exist
+    with the same columns.
+
+    Parameters:
+    - db_name (str): The name of the SQLite database file.
+    - part_dbs (list): The paths of the part database files.
+    - quick_mode (bool): If True, uses a larger page cache for faster merging.
+    - conn (sqlite3.Connection): A connection to the database to reuse, with no transaction in progress. Default
+      is None, which opens a connection for this call only, using db_name.
+
+    Returns:
+    None
+    """
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(db_name, timeout=3600)
+    try:
+        if quick_mode:
+            conn.execute('PRAGMA cache_size = -262144;')
+
+        for part_db in part_dbs:
+            conn.execute('ATTACH DATABASE ? AS part;', (part_db,))
+            try:
+                table_names = [row[0] for row in conn.execute("SELECT name FROM part.sqlite_master WHERE type='table';")]
+
+                # Copy each part in a single transaction
+                with conn:
+                    for table_name in table_names:
+                        conn.execute(f'INSERT INTO main."{table_name}" SELECT * FROM part."{table_name}";')
+            finally:
+                conn.execute('DETACH DATABASE part;')
+
+            os.remove(part_db)
+    finally:
+        if own_connection:
+            conn.close()
+
+
+def _drop_indexes(conn, table_name):
+    """
+    Drop the 'idx_' indexes that create_index built on a table, without committing.
+
+    Parameters:
+    - conn (sqlite3.Connection): An open connection to the database.
+    - table_name (str): The name of the table.
+
+    Returns:
+    None
+    """
+    index_names = conn.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name=? AND name GLOB 'idx_*';",
+                               (table_name,)).fetchall()
+    for (index_name,) in index_names:
+        conn.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
 @timing_decorator
-def create_index(db_name, table_name):
+def create_index(db_name, table_name, drop_existing=True, indexes=None, conn=None):
     """
     This function creates or updates indexes for specified columns in a SQLite database table.
 
     Parameters:
     - db_name (str): The name of the SQLite database file.
     - table_name (str): The name of the table for which indexes will be created or updated.
+    - drop_existing (bool): If True, drops the table's existing 'idx_' indexes first so they are rebuilt. Set to
+      False when the indexes are being created for the first time. Default is True.
+    - indexes (list): The indexes to create, each given as a tuple of column names; a tuple of several columns
+      creates a compound index. Default is DEFAULT_INDEXES.
+    - conn (sqlite3.Connection): A connection to the database to reuse, with no transaction in progress. Default
+      is None, which opens a connection for this call only, using db_name.
 
     Returns:
     None
     """
-    # Connect to the SQLite database
-    with sqlite3.connect(db_name) as conn:
-        try:
-            # Create a cursor to execute SQL statements
-            cursor = conn.cursor()
+    # Connect to the SQLite database, unless the caller shares its connection
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(db_name)
+    try:
+        # Create a cursor to execute SQL statements
+        cursor = conn.cursor()
+
+        # Define the columns for which indexes will be created or updated
+        if indexes is None:
+            indexes = DEFAULT_INDEXES
 
-            # Define the columns for which indexes will be created or updated
-            indexes = ["案件名称", "案号", "法院", "案由"]
+        # Drop and create all indexes in one transaction, so they are written with a single commit. Taking
+        # the exclusive lock up front makes another importer wait here rather than fail half-way
+        conn.execute('BEGIN EXCLUSIVE')
 
-            # Drop existing indexes for the specified columns
-            for index in indexes:
-                cursor.execute(f'DROP INDEX IF EXISTS "idx_{table_name}_{index}"')
+        # Drop existing indexes of the table, only needed when updating them. This includes indexes
+        # no longer in the list, such as those left by an earlier set of defaults
+        if drop_existing:
+            _drop_indexes(conn, table_name)
 
-            # Create indexes one by one for the specified columns
-            for index in indexes:
-                # Create a parameterized SQL statement for index creation
-                sql_statement = f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_{index}" ON "{table_name}" ("{index}")'
+        # Create indexes one by one for the specified columns
+        for index in indexes:
+            index_name = f"idx_{table_name}_{'_'.join(index)}"
+            columns = ', '.join(f'"{column}"' for column in index)
 
-                # Execute the SQL statement to create or update the index
+            # Create a parameterized SQL statement for index creation
+            sql_statement = f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table_name}" ({columns})'
+
+            # Execute the SQL statement to create or update the index, skipping it if it cannot be
+            # created so the other indexes are still built. Some errors, such as a full disk, make SQLite
+            # roll back the whole transaction, drops included, so stop there instead of going on outside it
+            try:
                 cursor.execute(sql_statement)
+            except sqlite3.OperationalError as e:
+                if not conn.in_transaction:
+                    raise
+                print(f"Skipping index {index_name}: {e}")
+
+        # Commit changes to the database
+        print(f"Indexes created or updated for table {table_name}")
+        conn.commit()
+
+        # Gather the statistics of the new indexes into sqlite_stat1, so the query planner can choose
+        # between them for the conditions built by query_data
+        cursor.execute(f'ANALYZE "{table_name}"')
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"Error creating or updating indexes: {e}")
+    finally:
+        if own_connection:
+            conn.close()
+
+
+def get_fts_table_name(table_name, fulltext=False):
+    """
+    Function to name the trigram full-text index of a case table.
+
+    Parameters:
+    - table_name (str): The name of the case table.
+    - fulltext (bool): If True, names the optional index over FULLTEXT_FTS_COLUMNS instead of the one over
+      FTS_COLUMNS. Default is False.
+
+    Returns:
+    - fts_table (str): The name of the FTS5 table.
+    """
+    return f"{table_name}_fulltext_fts" if fulltext else f"{table_name}_fts"
+
+
+def get_create_fts_query(table_name, fulltext=False):
+    """
+    Function to build the SQL statement creating a trigram full-text index of a case table.
+
+    The statement is written exactly as SQLite stores it in sqlite_master, so an existing index can be compared
+    with it to tell whether it was built with other columns or another tokenizer.
+
+    Parameters:
+    - table_name (str): The name of the case table.
+    - fulltext (bool): If True, builds the optional index over FULLTEXT_FTS_COLUMNS instead of the one over
+      FTS_COLUMNS. Default is False.
+
+    Returns:
+    - create_fts_query (str): The CREATE VIRTUAL TABLE statement.
+    """
+    columns = ', '.join(f'"{column}"' for column in (FULLTEXT_FTS_COLUMNS if fulltext else FTS_COLUMNS))
+
+    # Match case like 'LIKE' does in query_data, as get_query_connection turns on case_sensitive_like
+    return (f'CREATE VIRTUAL TABLE "{get_fts_table_name(table_name, fulltext)}" USING fts5({columns}, '
+            f"content='{table_name}', content_rowid='rowid', tokenize='trigram case_sensitive 1')")
+
+
+def get_fts_sql(conn, table_name, fulltext=False):
+    """
+    Function to read the stored SQL statement of a trigram full-text index of a case table.
+
+    Parameters:
+    - conn (sqlite3.Connection): An open connection to the database.
+    - table_name (str): The name of the case table.
+    - fulltext (bool): If True, reads the optional index over FULLTEXT_FTS_COLUMNS instead of the one over
+      FTS_COLUMNS. Default is False.
+
+    Returns:
+    - fts_sql (str): The CREATE VIRTUAL TABLE statement, or None if the index does not exist.
+    """
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?;",
+                       (get_fts_table_name(table_name, fulltext),)).fetchone()
+    return row[0] if row else None
 
-            # Commit changes to the database
-            print(f"Indexes created or updated for table {table_name}")
-            conn.commit()
+
+@timing_decorator
+def create_fts_index(db_name, table_name, conn=None, fulltext=False):
+    """
+    This function creates or rebuilds a trigram full-text search index for a SQLite database table.
+
+    The index is an external-content FTS5 table named '{table_name}_fts' covering FTS_COLUMNS, or with fulltext
+    '{table_name}_fulltext_fts' covering FULLTEXT_FTS_COLUMNS. The trigram
+    tokenizer indexes every 3-character sequence, case-sensitively, so substring searches on Chinese text can use the index
+    instead of scanning the whole table.
+
+    Parameters:
+    - db_name (str): The name of the SQLite database file.
+    - table_name (str): The name of the table for which the full-text index will be created or rebuilt.
+    - conn (sqlite3.Connection): A connection to the database to reuse, with no transaction in progress. Default
+      is None, which opens a connection for this call only, using db_name.
+    - fulltext (bool): If True, builds the optional index over FULLTEXT_FTS_COLUMNS. Default is False.
+
+    Returns:
+    None
+    """
+    fts_table = get_fts_table_name(table_name, fulltext)
+    create_fts_query = get_create_fts_query(table_name, fulltext)
+
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(db_name)
+    try:
+        # Create and fill the index in one transaction, so a failed rebuild does not leave an empty index
+        # behind for query_data to search
+        conn.execute('BEGIN')
+
+        # Replace an index built over other columns or with another tokenizer, it is rebuilt from the table
+        # below anyway
+        fts_sql = get_fts_sql(conn, table_name, fulltext)
+        if fts_sql is not None and fts_sql != create_fts_query:
+            conn.execute(f'DROP TABLE "{fts_table}"')
+            fts_sql = None
+
+        if fts_sql is None:
+            conn.execute(create_fts_query)
+
+        # Re-read the whole content table, as rows are appended without updating the index
+        conn.execute(f"""INSERT INTO "{fts_table}"("{fts_table}") VALUES('rebuild')""")
+
+        print(f"Full-text index {fts_table} created or updated for table {table_name}")
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"Error creating or updating full-text index: {e}")
+
+        # An existing index that could not be rebuilt may be missing rows, drop it so query_data
+        # falls back to 'LIKE'
+        try:
+            conn.execute(f'DROP TABLE IF EXISTS "{fts_table}"')
         except sqlite3.Error as e:
-            conn.rollback()
-            print(f"Error creating or updating indexes: {e}")
+            print(f"Error dropping full-text index: {e}")
+    finally:
+        if own_connection:
+            conn.close()
+
+
+def get_case_tables(conn):
+    """
+    Function to list the case tables of a SQLite database, leaving out full-text index and internal tables.
+
+    Parameters:
+    - conn (sqlite3.Connection): An open connection to the database.
+
+    Returns:
+    - table_names (list): The names of the case tables.
+    """
+    # Internal tables such as sqlite_stat1, written by ANALYZE, start with 'sqlite_'
+    rows = conn.execute("SELECT name, sql FROM sqlite_master WHERE type='table' AND name NOT GLOB 'sqlite_*';").fetchall()
+
+    # FTS5 tables are virtual tables backed by '{name}_*' shadow tables
+    fts_tables = [name for name, sql in rows if sql.upper().startswith('CREATE VIRTUAL TABLE')]
+
+    return [name for name, sql in rows
+            if not any(name == fts_table or name.startswith(f"{fts_table}_") for fts_table in fts_tables)]
+
+
+def check_identifiers(conn, table_name, column_names=()):
+    """
+    Function to make sure a table and its columns exist before their names are put into a SQL statement.
+
+    Table and column names cannot be passed as query parameters, so they are checked against the
+    database schema instead.
+
+    Parameters:
+    - conn (sqlite3.Connection): An open connection to the database.
+    - table_name (str): Name of the table.
+    - column_names (iterable): Names of columns that must exist in the table. Default is no columns.
+
+    Raises:
+    - ValueError: If the table or one of the columns does not exist.
+    """
+    if table_name not in get_case_tables(conn):
+        raise ValueError(f"Unknown table: {table_name}")
+
+    table_columns = [row[1] for row in conn.execute(f'PRAGMA table_info("{table_name}");')]
+    for column_name in column_names:
+        if column_name not in table_columns:
+            raise ValueError(f"Unknown column: {column_name}")
+
+
+def get_query_connection(db_name):
+    """
+    Function to get the shared connection used for queries on a SQLite database, opening it on first use.
+
+    Reusing one connection keeps SQLite's prepared statement cache warm across queries. Callers must hold
+    _query_lock while using the connection, as it may be shared between threads.
+
+    Parameters:
+    - db_name (str): Name of the SQLite database.
+
+    Returns:
+    - db_connection (sqlite3.Connection): The shared connection to the database.
+    """
+    with _query_lock:
+        db_connection = _query_connections.get(db_name)
+        if db_connection is None:
+            db_connection = sqlite3.connect(db_name, check_same_thread=False, cached_statements=256)
+
+            # Let prefix 'LIKE' patterns use the BINARY-collated column indexes
+            db_connection.execute('PRAGMA case_sensitive_like = ON;')
+            # Read up to 1 GiB of the database through memory mapping instead of copying pages
+            db_connection.execute('PRAGMA mmap_size = 1073741824;')
+
+            _query_connections[db_name] = db_connection
+
+        return db_connection
 
 
 @timing_decorator
-def create_indexes_for_all_tables():
+def create_indexes_for_all_tables(fulltext=False):
     db_name = db_name_entry.get()
     conn = sqlite3.connect(db_name)
     try:
-        cursor = conn.cursor()
-
-        # Get a list of all tables in the database
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
+        # Get a list of all case tables in the database
+        tables = get_case_tables(conn)
 
         # Iterate through each table and create/update indexes
-        for table in tables:
-            table_name = table[0]
-            create_index(db_name, table_name)
+        for table_name in tables:
+            create_index(db_name, table_name, conn=conn)
+            create_fts_index(db_name, table_name, conn=conn)
+
+            # Build the index over the judgments when asked for, and keep one built earlier up to date
+            if fulltext or get_fts_sql(conn, table_name, fulltext=True) is not None:
+                create_fts_index(db_name, table_name, conn=conn, fulltext=True)
+
+        # Let SQLite refresh any statistics that are still missing or out of date
+        conn.execute("PRAGMA optimize")
 
     except sqlite3.Error as e:
         print(f"Error creating or updating indexes: {e}")
@@ -205,7 +1010,7 @@ def create_indexes_for_all_tables():
         conn.close()
 
 
-def query_data(searching_dict, table_name='chinese_cases', fuzzy_search=True):
+def query_data(searching_dict, table_name='chinese_cases', fuzzy_search=True, db_name='Chinese_Cases.db'):
     """
     Function to query data from a SQLite database.
 
@@ -215,8 +1020,12 @@ def query_data(searching_dict, table_name='chinese_cases', fuzzy_search=True):
 
     - table_name (str): Name of the table in the database to query. Default is 'chinese_cases'.
 
-    - fuzzy_search (bool): If True, performs a fuzzy search using 'LIKE'; if False, performs an
-    exact match using '='. Default is True.
+    - fuzzy_search (bool): If True, performs a fuzzy search, through the trigram full-text index covering
+    the column when the table has one and using 'LIKE' otherwise; values containing the '%' or '_' wildcards are used as
+    'LIKE' patterns as they are, so a prefix pattern such as '张%' can use the column's index. If False,
+    performs an exact match using 'IN'. Default is True.
+
+    - db_name (str): Name of the SQLite database. Default is 'Chinese_Cases.db'.
 
     Returns:
     - result (pd.DataFrame): A Pandas DataFrame containing the query results.
@@ -224,62 +1033,101 @@ def query_data(searching_dict, table_name='chinese_cases', fuzzy_search=True):
     # Make a copy of searching_dict to avoid modifying the original dictionary
     searching_dict = dict(searching_dict)
 
-    # Connect to the SQLite database
-    db_connection = sqlite3.connect('Chinese_Case.db')
-
-    # Build the criteria string for the SQL query
-    criteria = []
-
-    # Build the list of query parameters
-    values = []
-
-    for column, column_values in searching_dict.items():
-        # Handle fuzzy search and exact match
-        if fuzzy_search:
-            conditions = [f"{column} LIKE '%{value}%'" for value in column_values]
-        else:
-            conditions = [f"{column} = '{value}'" for value in column_values]
-
-        criteria.append(f"({' OR '.join(conditions)})")
-
-        # Add the parameters to the values list
-        values.extend(column_values)
-
-    # Build the complete SQL query statement
-    query = f"SELECT * FROM {table_name} WHERE {' AND '.join(criteria)};"
-    print(query)
-
-    # Execute the query and store the result in a Pandas DataFrame
-    result = pd.read_sql_query(query, db_connection)
-
-    # Close the database connection
-    db_connection.close()
+    with _query_lock:
+        # Get the shared connection to the SQLite database
+        db_connection = get_query_connection(db_name)
+
+        # Names cannot be bound as parameters, so only accept existing ones
+        check_identifiers(db_connection, table_name, searching_dict.keys())
+
+        # Build the criteria string for the SQL query
+        criteria = []
+
+        # Build the list of query parameters
+        values = []
+
+        # Find the trigram full-text index covering each column, among those built for this table. An
+        # index from an older version may ignore case, which 'LIKE' does not, so it is only used once
+        # create_fts_index has rebuilt it
+        fts_tables = {}
+        for fulltext, fts_columns in ((False, FTS_COLUMNS), (True, FULLTEXT_FTS_COLUMNS)):
+            if get_fts_sql(db_connection, table_name, fulltext) == get_create_fts_query(table_name, fulltext):
+                fts_tables.update(dict.fromkeys(fts_columns, get_fts_table_name(table_name, fulltext)))
+
+        for column, column_values in searching_dict.items():
+            column_values = [str(value) for value in column_values]
+
+            # A column without values does not restrict the search
+            if not column_values:
+                continue
+
+            # Handle fuzzy search and exact match
+            if not fuzzy_search:
+                # A single IN list is answered with index seeks instead of one comparison per value
+                criteria.append(f'("{column}" IN ({", ".join("?" * len(column_values))}))')
+                values.extend(column_values)
+                continue
+
+            conditions = []
+            for value in column_values:
+                if '%' in value or '_' in value:
+                    # The value is already a 'LIKE' pattern, use it as given
+                    conditions.append(f'"{column}" LIKE ?')
+                    values.append(value)
+                # The trigram tokenizer can only match substrings of at least 3 characters
+                elif column in fts_tables and len(value) >= 3:
+                    conditions.append(f'rowid IN (SELECT rowid FROM "{fts_tables[column]}" WHERE "{column}" MATCH ?)')
+                    # Quote the value as an FTS5 string so it is matched literally
+                    values.append('"' + value.replace('"', '""') + '"')
+                else:
+                    conditions.append(f'"{column}" LIKE ?')
+                    values.append(f"%{value}%")
+
+            criteria.append(f"({' OR '.join(conditions)})")
+
+        # Without any value the query would load the whole table, full texts included
+        if not criteria:
+            raise ValueError("No search values given")
+
+        # Build the complete SQL query statement, with every value bound as a parameter
+        query = f'SELECT * FROM "{table_name}" WHERE {" AND ".join(criteria)};'
+        print(query)
+
+        # Execute the query and store the result in a Pandas DataFrame
+        result = pd.read_sql_query(query, db_connection, params=values)
 
     return result
 
 
-def get_unique_values(db_name='Chinese_Case.db', table_name='chinese_cases', column_name='案件类型'):
+def get_unique_values(db_name='Chinese_Cases.db', table_name='chinese_cases', column_name='案件类型'):
     """
     Function to retrieve unique values from a specific column in a SQLite database table.
 
     Parameters:
-    - db_name (str): Name of the SQLite database. Default is 'Chinese_Case.db'.
+    - db_name (str): Name of the SQLite database. Default is 'Chinese_Cases.db'.
     - table_name (str): Name of the table in the database. Default is 'chinese_cases'.
-    - column_name (str): Name of the column from which to retrieve unique values. Default is 'case_type'.
+    - column_name (str): Name of the column from which to retrieve unique values. Default is '案件类型'.
 
     Returns:
     - unique_values (list): A list of unique values from the specified column.
     """
     try:
-        # Connect to the database
-        db_connection = sqlite3.connect(db_name)
+        with _query_lock:
+            # Get the shared connection to the database
+            db_connection = get_query_connection(db_name)
 
-        # Execute SQL query to get unique values
-        query = f"SELECT DISTINCT {column_name} FROM {table_name};"
-        unique_values = pd.read_sql_query(query, db_connection)[column_name].tolist()
+            # Names cannot be bound as parameters, so only accept existing ones
+            check_identifiers(db_connection, table_name, [column_name])
 
-        # Close the database connection
-        db_connection.close()
+            # Execute SQL query to get unique values
+            query = f'SELECT DISTINCT "{column_name}" FROM "{table_name}";'
+            cursor = db_connection.execute(query)
+
+            # Read the values straight from the cursor in batches, without building a DataFrame
+            # or a full list of row tuples on top of the result list
+            unique_values = []
+            while rows := cursor.fetchmany(10000):
+                unique_values.extend(row[0] for row in rows)
 
         return unique_values
 
@@ -298,6 +1146,113 @@ def browse_folder():
 
 
 @timing_decorator
+def _ingest_worker(db_name, files, delimiter, quick_mode, no_index, progress_queue):
+    """
+    Load CSV files into the database and index the tables, reporting progress through a queue.
+
+    Runs in a background thread and never touches Tk widgets. After each loaded file it puts an
+    (i, file_name) tuple on the queue, then None once everything is done, or the exception that
+    stopped it.
+
+    Parameters:
+    - db_name (str): The name of the SQLite database file.
+    - files (list): The paths of the CSV files to be loaded.
+    - delimiter (str): The delimiter used in the CSV files to separate values.
+    - quick_mode (bool): If True, enables quick mode for faster data loading.
+    - no_index (bool): If True, skips index creation after loading.
+    - progress_queue (queue.Queue): The queue receiving the progress messages.
+
+    Returns:
+    None
+    """
+    conn = None
+    try:
+        # Group the files by target table, keeping the order in which the tables are found
+        table_files = {}
+        for file in files:
+            table_name = os.path.basename(file)[:4]  # 8 if hardware performance is insufficient
+            table_files.setdefault(table_name, []).append(file)
+
+        # One connection to the database serves every step of the run. The worker processes only
+        # write to their own part databases and never open the database itself
+        conn = sqlite3.connect(db_name, timeout=3600, cached_statements=256)
+
+        # Create each table once up front instead of once per file
+        with conn:
+            for table_name in table_files:
+                conn.execute(get_create_table_query(table_name))
+
+        # Every file is loaded independently, so spread them over a pool of worker processes.
+        # Each worker process loads its files into its own part database through one connection
+        part_dbs = []
+        try:
+            # No more processes than files, as each process only helps with the files it is given
+            max_workers = max(min(os.cpu_count() or 1, len(files)), 1)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(db_name, quick_mode)) as executor:
+                futures = {}
+                for table_name, table_file_list in table_files.items():
+                    for file in table_file_list:
+                        future = executor.submit(_load_in_worker, file, table_name, delimiter)
+                        futures[future] = os.path.basename(file)
+
+                try:
+                    for i, future in enumerate(as_completed(futures), start=1):
+                        part_db = future.result()
+                        if part_db not in part_dbs:
+                            part_dbs.append(part_db)
+                        progress_queue.put((i, futures[future]))
+                except BaseException:
+                    # The import has failed, do not start loading the files still waiting in the queue
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+
+            # In quick mode, keep the database locked from the first write of the merge until the run
+            # ends, instead of taking and releasing the lock for each transaction
+            if quick_mode:
+                conn.execute('PRAGMA locking_mode = EXCLUSIVE;')
+
+            # Importing into tables that already hold data and indexes, maintaining the indexes row by row
+            # is slower than building them again once everything is in, which happens below
+            if no_index is False:
+                with conn:
+                    for table_name in table_files:
+                        _drop_indexes(conn, table_name)
+            else:
+                # The full-text indexes are not updated by inserts and will not be rebuilt this time. Drop them, so
+                # query_data falls back to 'LIKE' and still finds the new rows until the indexes are recreated
+                with conn:
+                    for table_name in table_files:
+                        conn.execute(f'DROP TABLE IF EXISTS "{get_fts_table_name(table_name)}"')
+                        conn.execute(f'DROP TABLE IF EXISTS "{get_fts_table_name(table_name, fulltext=True)}"')
+
+            # The workers have exited and released their parts, copy them into the database
+            merge_part_databases(db_name, part_dbs, quick_mode, conn=conn)
+        finally:
+            # Remove parts left over by a failed import. The pool has exited by now, so look for them on disk,
+            # as a worker may have created its part without any of its files being reported loaded
+            for part_db in find_part_databases(db_name):
+                os.remove(part_db)
+
+        # Index each table once all of its files have been loaded
+        if no_index is False:
+            for table_name in table_files:
+                create_index(db_name=db_name, table_name=table_name, drop_existing=False, conn=conn)
+                create_fts_index(db_name=db_name, table_name=table_name, conn=conn)
+
+                # The index over the judgments is only built on request, but one built earlier must take
+                # in the new rows
+                if get_fts_sql(conn, table_name, fulltext=True) is not None:
+                    create_fts_index(db_name=db_name, table_name=table_name, conn=conn, fulltext=True)
+
+        progress_queue.put(None)
+    except Exception as e:
+        progress_queue.put(e)
+    finally:
+        if conn is not None:
+            conn.close()
+
+
 def start_create_database():
     db_name = db_name_entry.get()
     csv_dir = csv_path_entry.get()
@@ -325,7 +1280,10 @@ def start_create_database():
         error_window_btn_text = '关闭'
         error_window_path_text = '请先选择CSV路径'
 
+    # Recreating the indexes during an import would wait on its write lock with the window frozen,
+    # so both buttons stay disabled until the import is over
     create_button.configure(text=btn_text_Creating, state='disabled')
+    create_index_button.configure(state='disabled')
     if not csv_dir:
         error_window = tk.Toplevel(window)
         error_window.title(error_window_title)
@@ -334,6 +1292,7 @@ def start_create_database():
 
         def _reset():
             create_button.configure(text=btn_text_Done, state='normal')
+            create_index_button.configure(state='normal')
             error_window.destroy()
 
         close_button = tk.Button(error_window, text=error_window_btn_text, command=_reset)
@@ -346,9 +1305,10 @@ def start_create_database():
         create_status_window = tk.Toplevel(window, width=600, height=400)
         create_status_window.title(create_status_window_title)
         files = find_csv_files(csv_dir)
+        # Count the progress in files, so each loaded file advances the bar by one step
         pb = ttk.Progressbar(create_status_window,
                              length=100,
-                             maximum=100,
+                             maximum=max(len(files), 1),
                              mode='determinate',
                              orient="horizontal",
                              )
@@ -356,34 +1316,44 @@ def start_create_database():
         loading_file_text = tk.Label(create_status_window, text="")
         loading_file_text.pack(pady=10)
 
-        previous_table_name = None
-
-        for i in range(len(files)):
-            file_name = os.path.basename(files[i])
-            loading_file_text.config(text=f"Loading {file_name}...")
-            create_status_window.update()
-            table_name = file_name[:4]  # 8 if hardware performance is insufficient
-
-            if previous_table_name is not None and previous_table_name != table_name and no_index is False:
-                create_index(db_name=db_name, table_name=previous_table_name)
-
-            previous_table_name = table_name
-            adding_CSV(db_name=db_name,
-                       csv_file=files[i],
-                       table_name=table_name,
-                       delimiter=delimiter,
-                       quick_mode=quick_mode)
-            pb['value'] = 100 * (i / len(files))
-
-        if previous_table_name is not None and no_index is False:
-            create_index(db_name=db_name, table_name=previous_table_name)
-
-        create_status_window.destroy()
-        result_label.config(text=completed_text)
-        create_button.configure(text=btn_text_Done, state='normal')
+        # Load the files in a background thread so the window stays responsive,
+        # and follow its progress by polling the queue from the Tk event loop
+        progress_queue = queue.Queue()
+        threading.Thread(target=_ingest_worker,
+                         args=(db_name, files, delimiter, quick_mode, no_index, progress_queue),
+                         daemon=True).start()
+        loading_file_text.config(text=f"Loading {len(files)} files...")
+
+        def _poll():
+            try:
+                while True:
+                    message = progress_queue.get_nowait()
+
+                    if message is None or isinstance(message, Exception):
+                        create_status_window.destroy()
+                        if message is None:
+                            result_label.config(text=completed_text)
+                        else:
+                            result_label.config(text=f"{error_text}{message}")
+                        create_button.configure(text=btn_text_Done, state='normal')
+                        create_index_button.configure(state='normal')
+                        return
+
+                    i, file_name = message
+                    loading_file_text.config(text=f"Loaded {file_name}")
+                    pb['value'] = i
+            except queue.Empty:
+                pass
+
+            window.after(PROGRESS_POLL_INTERVAL, _poll)
+
+        window.after(PROGRESS_POLL_INTERVAL, _poll)
 
     except Exception as e:
         result_label.config(text=f"{error_text}{e}")
+        # The import never started, so no poll will re-enable the buttons
+        create_button.configure(text=btn_text_Done, state='normal')
+        create_index_button.configure(state='normal')
 
 
 def show_about_window():
@@ -393,9 +1363,8 @@ def show_about_window():
     if current_language == "CN":
         about_window.title("About")
         about_text = ("""
-        [Extreme Mode]: only suitable for very stable computer environments, completely removes the default 
-        fault-tolerance function, brings faster import speed, but may produce erroneous data if power failure or 
-        insufficient hard disk performance.\n
+        [Extreme Mode]: uses more memory (about 512 MB per import process) to cache the database, brings faster 
+        import speed, and the data stays consistent after a power failure.\n
         [No Index]: further improves the import speed, but will reduce the final search speed. 
         You can rebuild the index of all tables with one click via the rebuild button.\n
         The program is primarily designed to adapt to the Chinese case database file (CSV) circulating online as of December 2023.\n
@@ -405,7 +1374,7 @@ def show_about_window():
     else:
         about_window.title("关于")
         about_text = (
-            "【极速模式】：只适合非常稳定的电脑环境，完全去掉默认的容错功能，带来更快的导入速度，但如断电或硬盘性能不足，可能会产生错误数据。\n\n"
+            "【极速模式】：使用更多内存（每个导入进程约512MB）缓存数据库，带来更快的导入速度，断电后数据仍保持一致。\n\n"
             "【不创建索引】：进一步提升导入速度，但会减少最终搜索速度。可以通过重建按钮一键重建全部表的索引。\n\n"
             "本程序主要适配2023年12月网上流传的中国案例数据库文件（CSV）\n\n"
             "一般情况下只需要选择文件夹路径即可，其他不需要改变\n\n"
@@ -427,7 +1396,14 @@ def confirm_and_create_indexes():
 
     # Check the user's response
     if result:
-        create_indexes_for_all_tables()
+        # The index over the judgments is several times larger than their text, so only build it on request
+        if current_language == "EN":
+            fulltext = messagebox.askyesno("全文索引", "是否同时为“全文”创建全文索引？\n"
+                                           "该索引比全文本身大数倍，创建需要更长的时间。")
+        else:
+            fulltext = messagebox.askyesno("FULL-TEXT INDEX", "Also build the full-text index over 全文?\n"
+                                           "It is several times larger than the text and takes much longer to build.")
+        create_indexes_for_all_tables(fulltext=fulltext)
 
 
 def toggle_language():